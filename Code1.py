@@ -1,18 +1,21 @@
 import pygame
 import numpy as np
 import math
-import random
-import qutip as qt
+import functools
 import socket
+import selectors
+import struct
 import threading
 import time
-import hashlib
 import hmac
-import base64
 import io
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Qiskit imports for real teleportation
 from qiskit import QuantumCircuit, ClassicalRegister, QuantumRegister, transpile, assemble, Aer, execute
+from qiskit.circuit.library import XGate
+from qiskit.quantum_info import Statevector
 from qiskit.providers.ibmq import IBMQ
 from qiskit.providers.aer import AerSimulator
 
@@ -20,6 +23,30 @@ from qiskit.providers.aer import AerSimulator
 from flask import Flask, Response, render_template_string
 from PIL import Image
 
+# JPEG encoder ladder for the MJPEG feed: PyTurboJPEG (persistent SIMD
+# libjpeg-turbo handle) > cv2.imencode > PIL
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _TURBO = TurboJPEG()
+except Exception:
+    _TURBO = None
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Cheap frame fingerprint for MJPEG dedup: xxhash when present, crc32 else
+try:
+    import xxhash
+
+    def _frame_hash(buf):
+        return xxhash.xxh3_64_intdigest(buf)
+except ImportError:
+    import zlib
+
+    def _frame_hash(buf):
+        return zlib.crc32(buf)
+
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 1000, 700
 FPS = 60
@@ -29,21 +56,86 @@ ACCENT_COLOR = (0, 200, 200)
 ALERT_COLOR = (255, 50, 80)
 SAMPLE_RATE = 44100
 
+_RNG = np.random.default_rng()
+
+def _rand_ket2(rng=_RNG):
+    """Haar-random single-qubit ket as a plain length-2 complex ndarray."""
+    v = rng.standard_normal(2) + 1j * rng.standard_normal(2)
+    return v / np.linalg.norm(v)
+
+# Per-frame visual kernels, filling caller-owned buffers so no per-frame
+# allocation happens. The NumPy versions below are the fallback; when numba
+# is installed they are replaced by JIT-compiled loops.
+def _osc_wave(nx, cy, freq, phase, amp, noise, out):
+    np.sin(nx * freq + phase, out=out)
+    out *= amp
+    out *= noise
+    out += cy
+
+def _polygon_xy(theta, cx, cy, radius, jitter, angle, out):
+    a = theta + angle
+    r = radius + jitter
+    out[:, 0] = cx + r * np.cos(a)
+    out[:, 1] = cy + r * np.sin(a)
+
+try:
+    import numba
+
+    @numba.njit(cache=True, fastmath=True)
+    def _osc_wave(nx, cy, freq, phase, amp, noise, out):
+        for i in range(nx.shape[0]):
+            out[i] = cy + np.sin(nx[i] * freq + phase) * amp * noise[i]
+
+    @numba.njit(cache=True, fastmath=True)
+    def _polygon_xy(theta, cx, cy, radius, jitter, angle, out):
+        for i in range(theta.shape[0]):
+            r = radius + jitter[i]
+            a = theta[i] + angle
+            out[i, 0] = cx + r * np.cos(a)
+            out[i, 1] = cy + r * np.sin(a)
+except ImportError:
+    pass
+
 # TELEPORT / SECURITY CONFIG
 USE_IBMQ_IF_AVAILABLE = True   # Set to False to force Aer simulator
 CLASSICAL_AUTH_SECRET = b"replace-with-secure-pre-shared-key"  # HMAC secret for classical channel authentication
 TELEPORT_CHUNK_SIZE = 8  # number of bits teleported per sequence (we teleport bits sequentially)
 
+# Wire framing (client -> server): <I little-endian frame length> + frame,
+# where frame = 1 type byte + body. Length-prefixing makes reassembly under
+# TCP fragmentation trivial and keeps payload bytes binary end to end.
+FRAME_AUTH = 0x01   # body = 32-byte HMAC-SHA256 + raw payload to teleport
+FRAME_CHAT = 0x02   # body = UTF-8 chat text
+MAX_FRAME_SIZE = 1 << 20  # drop connections sending absurd lengths
+
+# One period of sine at full scale; any frequency is synthesized from it by
+# integer stride indexing, so no transcendental runs at synthesis time.
+_SINE_LUT = (np.sin(np.linspace(0, 2 * np.pi, 4096, endpoint=False,
+                                dtype=np.float32)) * 32767).astype(np.int16)
+
+@functools.lru_cache(maxsize=32)
 def generate_sine_wave(freq, duration, volume=0.5):
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False)
-    wave = np.sin(freq * 2 * np.pi * t)
-    audio = (wave * volume * 32767).astype(np.int16)
-    return np.column_stack((audio, audio))
+    # Cached: each (freq, duration, volume) triple is rendered exactly once.
+    n = int(SAMPLE_RATE * duration)
+    # round, not truncate: int() would detune 440 Hz to ~430.7 Hz
+    step = round(freq * _SINE_LUT.shape[0] / SAMPLE_RATE)
+    idx = (np.arange(n, dtype=np.int64) * step) & (_SINE_LUT.shape[0] - 1)
+    audio = (_SINE_LUT[idx] * np.float32(volume)).astype(np.int16)
+    return np.ascontiguousarray(np.broadcast_to(audio[:, None], (n, 2)))
+
+# Persistent noise buffer (1s stereo); regenerations up to that length fill
+# it in place instead of allocating. make_sound copies out of it anyway.
+_NOISE_BUF = np.empty((SAMPLE_RATE, 2), dtype=np.int16)
 
 def generate_noise(duration, volume=0.2):
-    noise = np.random.uniform(-1, 1, int(SAMPLE_RATE * duration))
-    audio = (noise * volume * 32767).astype(np.int16)
-    return np.column_stack((audio, audio))
+    # Draw int16 samples directly; no float64 intermediate or column_stack copy.
+    n = int(SAMPLE_RATE * duration)
+    bound = int(volume * 32767)
+    buf = _NOISE_BUF[:n] if n <= _NOISE_BUF.shape[0] \
+        else np.empty((n, 2), dtype=np.int16)
+    buf[:, 0] = _RNG.integers(-bound, bound, size=n, dtype=np.int16, endpoint=True)
+    buf[:, 1] = buf[:, 0]
+    return buf
 
 class QTeleportationManager:
     """
@@ -58,7 +150,50 @@ class QTeleportationManager:
     def __init__(self, use_ibmq=USE_IBMQ_IF_AVAILABLE):
         self.backend = None
         self.backend_name = "aer_simulator"
+        # Transpiled-circuit caches: the teleport circuit only varies in the
+        # initial X and the corrections, so every variant is known up front.
+        self._tqc1 = None             # [bit] -> transpiled stage-1 circuit
+        self._tqc2 = None             # (bit, m0, m1) -> transpiled stage-2
+        # On a noiseless simulator the corrected readout is deterministic,
+        # so the whole second circuit can be skipped.
+        self._noiseless = False
+        # Aer instance seeded with the Bell pair already prepared, so the
+        # per-bit stage-1 circuit skips the h/cx prep gates entirely.
+        self._prep_backend = None
+        self._tqc1p = None            # [bit] -> transpiled post-prep circuit
+        # Template for the stage-1 circuit: built once, C-level copied per
+        # bit instead of reconstructing registers and circuit objects.
+        self._template_qc = QuantumCircuit(3, 2)
+        self._template_qc.h(1)
+        self._template_qc.cx(1, 2)
+        self._template_qc.cx(0, 1)
+        self._template_qc.h(0)
+        self._template_qc.measure([0, 1], [0, 1])
         self._init_backend(use_ibmq)
+        self._cache_transpiled()
+
+    def _cache_transpiled(self):
+        if self.backend is None:
+            return
+        try:
+            self._tqc1 = [transpile(self._build_teleport_circuit_for_bit(b),
+                                    self.backend, optimization_level=0)
+                          for b in (0, 1)]
+            self._tqc2 = {(b, m0, m1):
+                          transpile(self._build_correction_circuit(b, m0, m1),
+                                    self.backend, optimization_level=0)
+                          for b in (0, 1) for m0 in (0, 1) for m1 in (0, 1)}
+        except Exception as e:
+            print("Could not pre-transpile teleport circuits:", e)
+            self._tqc1 = self._tqc2 = None
+        if self._prep_backend is not None:
+            try:
+                self._tqc1p = [transpile(self._build_postprep_circuit_for_bit(b),
+                                         self._prep_backend, optimization_level=0)
+                               for b in (0, 1)]
+            except Exception as e:
+                print("Could not pre-transpile post-prep circuits:", e)
+                self._tqc1p = None
 
     def _init_backend(self, use_ibmq):
         # Try IBMQ if requested and available, otherwise fallback to Aer simulator
@@ -78,10 +213,28 @@ class QTeleportationManager:
         try:
             self.backend = AerSimulator()
             self.backend_name = "aer_simulator"
+            self._noiseless = True  # plain Aer, no noise model attached
             print("Using AerSimulator for teleportation")
         except Exception as e:
             self.backend = None
             print("No quantum backend available:", e)
+            return
+
+        # Amortize Bell-pair preparation: a dedicated statevector simulator
+        # starts every run from |0> (x) |Phi+>, so stage-1 circuits only
+        # carry the message prep, cx(0,1), h(0) and the measurement. The
+        # main backend keeps default initialization for the correction
+        # circuits, which re-prepare from scratch.
+        try:
+            prep = QuantumCircuit(3)
+            prep.h(1)
+            prep.cx(1, 2)
+            sv = Statevector.from_instruction(prep)
+            self._prep_backend = AerSimulator(method='statevector')
+            self._prep_backend.set_options(initial_statevector=sv.data)
+        except Exception as e:
+            self._prep_backend = None
+            print("Bell-pair initial_statevector unavailable:", e)
 
     def _build_teleport_circuit_for_bit(self, bit_value):
         """
@@ -90,82 +243,30 @@ class QTeleportationManager:
         - q1: Alice's half of Bell pair
         - q2: Bob's half of Bell pair
         We measure q0 and q1 and apply corrections to q2, then measure q2 to read teleported bit.
-        """
-        q = QuantumRegister(3, 'q')
-        c = ClassicalRegister(2, 'c')  # c0,c1 for Alice's measurement
-        qc = QuantumCircuit(q, c)
 
-        # Prepare message qubit
+        Copies the prebuilt template and, for bit 1, prepends the prep X —
+        much cheaper than rebuilding registers and circuit every call.
+        """
+        qc = self._template_qc.copy()
         if bit_value == 1:
-            qc.x(q[0])
-
-        # Create Bell pair between q1 and q2 (Alice & Bob)
-        qc.h(q[1])
-        qc.cx(q[1], q[2])
-
-        # Bell measurement between message (q0) and q1
-        qc.cx(q[0], q[1])
-        qc.h(q[0])
-        qc.measure(q[0], c[0])
-        qc.measure(q[1], c[1])
-
+            qc.data.insert(0, (XGate(), [qc.qubits[0]], []))
         return qc
 
-    def teleport_bit(self, bit):
-        """
-        Teleport a single classical bit (0 or 1). Returns a dict:
-          {
-            "input_bit": bit,
-            "alice_bits": (m0, m1),
-            "teleported_bit": 0 or 1,
-            "success": True/False,
-            "backend": self.backend_name
-          }
-        """
-        if self.backend is None:
-            raise RuntimeError("No quantum backend available for teleportation")
-
-        # Build initial circuit (prepare + entanglement + Alice measurement)
-        qc1 = self._build_teleport_circuit_for_bit(bit)
-
-        # Execute to obtain Alice's measurement results (shots=1 for deterministic run)
-        job = execute(qc1, backend=self.backend, shots=1)
-        result = job.result()
-        # Try to get memory; fall back to counts parsing
-        mem = None
-        try:
-            memlist = result.get_memory()
-            if memlist and len(memlist) > 0:
-                mem = memlist[0]
-        except Exception:
-            mem = None
-
-        if mem:
-            # mem is order c1c0 or similar - handle both 2 or more chars
-            if len(mem) >= 2:
-                # take last two as c1,c0 if in order c1c0
-                m1, m0 = int(mem[-2]), int(mem[-1])
-            else:
-                m0 = int(mem[-1])
-                m1 = 0
-        else:
-            # fallback parse counts key
-            try:
-                counts = result.get_counts()
-                measured_key = next(iter(counts.keys()))
-                if len(measured_key) >= 2:
-                    m1, m0 = int(measured_key[-2]), int(measured_key[-1])
-                elif len(measured_key) == 1:
-                    m1, m0 = 0, int(measured_key[-1])
-                else:
-                    m1, m0 = 0, 0
-            except Exception:
-                m1, m0 = 0, 0
-
-        alice_m0 = int(m0)
-        alice_m1 = int(m1)
+    def _build_postprep_circuit_for_bit(self, bit_value):
+        """Stage-1 circuit for the Bell-seeded backend: the h(1)/cx(1,2)
+        prep is baked into the simulator's initial statevector, so only the
+        message prep, Bell measurement basis change and readout remain."""
+        qc = QuantumCircuit(3, 2)
+        if bit_value == 1:
+            qc.x(0)
+        qc.cx(0, 1)
+        qc.h(0)
+        qc.measure([0, 1], [0, 1])
+        return qc
 
-        # Now build second circuit to prepare Bob's qubit and apply classical corrections
+    def _build_correction_circuit(self, bit, m0, m1):
+        """Bob's side: re-prepare the entangled state and apply the X/Z
+        corrections dictated by Alice's measurement, then read out q2."""
         q = QuantumRegister(3, 'q')
         c = ClassicalRegister(1, 'c2')
         qc2 = QuantumCircuit(q, c)
@@ -173,48 +274,145 @@ class QTeleportationManager:
             qc2.x(q[0])
         qc2.h(q[1])
         qc2.cx(q[1], q[2])
-
-        # Apply corrections to q2 based on Alice's measurement results
-        if alice_m1 == 1:
+        if m1 == 1:
             qc2.x(q[2])
-        if alice_m0 == 1:
+        if m0 == 1:
             qc2.z(q[2])
         qc2.measure(q[2], c[0])
+        return qc2
 
-        job2 = execute(qc2, backend=self.backend, shots=1)
-        res2 = job2.result()
+    @staticmethod
+    def _parse_alice_bits(result, index=0):
+        """Extract Alice's (m0, m1) bits from one experiment of a result;
+        tries memory first, falls back to counts parsing."""
+        mem = None
+        try:
+            memlist = result.get_memory(index)
+            if memlist and len(memlist) > 0:
+                mem = memlist[0]
+        except Exception:
+            mem = None
+
+        if mem is None:
+            try:
+                mem = next(iter(result.get_counts(index).keys()))
+            except Exception:
+                mem = "00"
 
-        mem2 = None
+        # mem is order c1c0 or similar - handle both 2 or more chars
+        if len(mem) >= 2:
+            m1, m0 = int(mem[-2]), int(mem[-1])
+        else:
+            m1, m0 = 0, int(mem[-1])
+        return m0, m1
+
+    @staticmethod
+    def _parse_bob_bit(result, index=0):
+        """Extract the teleported bit from one experiment of a result."""
         try:
-            mem2 = res2.get_memory()[0]
+            mem2 = result.get_memory(index)[0]
         except Exception:
             try:
-                mem2 = next(iter(res2.get_counts().keys()))
+                mem2 = next(iter(result.get_counts(index).keys()))
             except Exception:
                 mem2 = '0'
+        return int(mem2[-1])
+
+    def teleport_bit(self, bit):
+        """
+        Teleport a single classical bit (0 or 1). Returns a dict:
+          {
+            "input_bit": bit,
+            "alice_bits": (m0, m1),
+            "teleported_bit": 0 or 1,
+            "success": True/False,
+            "backend": self.backend_name
+          }
+        """
+        if self.backend is None:
+            raise RuntimeError("No quantum backend available for teleportation")
 
-        teleported_bit = int(mem2[-1])
-        success = (teleported_bit == bit)
+        # Obtain Alice's measurement results (shots=1 for deterministic run),
+        # reusing the pre-transpiled circuit when available.
+        if self._tqc1p is not None:
+            result = self._prep_backend.run(self._tqc1p[bit], shots=1,
+                                            memory=True).result()
+        elif self._tqc1 is not None:
+            result = self.backend.run(self._tqc1[bit], shots=1, memory=True).result()
+        else:
+            qc1 = self._build_teleport_circuit_for_bit(bit)
+            result = execute(qc1, backend=self.backend, shots=1).result()
+        alice_m0, alice_m1 = self._parse_alice_bits(result)
+
+        # Second circuit prepares Bob's qubit and applies classical
+        # corrections. On a noiseless simulator its readout always equals
+        # the input bit, so running it would be pure overhead.
+        if self._noiseless:
+            teleported_bit = int(bit)
+        elif self._tqc2 is not None:
+            res2 = self.backend.run(self._tqc2[(bit, alice_m0, alice_m1)],
+                                    shots=1, memory=True).result()
+            teleported_bit = self._parse_bob_bit(res2)
+        else:
+            qc2 = self._build_correction_circuit(bit, alice_m0, alice_m1)
+            res2 = execute(qc2, backend=self.backend, shots=1).result()
+            teleported_bit = self._parse_bob_bit(res2)
 
         return {
             "input_bit": int(bit),
             "alice_bits": (alice_m0, alice_m1),
             "teleported_bit": teleported_bit,
-            "success": success,
+            "success": teleported_bit == bit,
             "backend": self.backend_name
         }
 
     def teleport_bytes(self, data_bytes):
         """
-        Teleport bytes by teleporting each bit sequentially.
+        Teleport bytes as two batched jobs: one submission carrying every
+        per-bit Bell-measurement circuit, then one carrying the corrected
+        readout circuits. Submission/transpile overhead dominates tiny
+        circuits, so batching beats 16 jobs per byte by a wide margin.
         Returns a list of per-bit results.
         """
+        if self.backend is None:
+            raise RuntimeError("No quantum backend available for teleportation")
+
+        bits = [(byte >> i) & 0x1 for byte in data_bytes for i in range(7, -1, -1)]
+        if not bits:
+            return []
+
+        if self._tqc1p is not None:
+            qcs1 = [self._tqc1p[b] for b in bits]
+            res1 = self._prep_backend.run(qcs1, shots=1, memory=True).result()
+        else:
+            if self._tqc1 is not None:
+                qcs1 = [self._tqc1[b] for b in bits]
+            else:
+                qcs1 = transpile([self._build_teleport_circuit_for_bit(b) for b in bits],
+                                 self.backend)
+            res1 = self.backend.run(qcs1, shots=1, memory=True).result()
+        alice = [self._parse_alice_bits(res1, i) for i in range(len(bits))]
+
+        if self._noiseless:
+            teleported_bits = [int(b) for b in bits]
+        else:
+            if self._tqc2 is not None:
+                qcs2 = [self._tqc2[(b, m0, m1)] for b, (m0, m1) in zip(bits, alice)]
+            else:
+                qcs2 = transpile([self._build_correction_circuit(b, m0, m1)
+                                  for b, (m0, m1) in zip(bits, alice)], self.backend)
+            res2 = self.backend.run(qcs2, shots=1, memory=True).result()
+            teleported_bits = [self._parse_bob_bit(res2, i) for i in range(len(bits))]
+
         results = []
-        for byte in data_bytes:
-            for i in range(8):
-                bit = (byte >> (7 - i)) & 0x1
-                res = self.teleport_bit(bit)
-                results.append(res)
+        for bit, (m0, m1), teleported in zip(bits, alice, teleported_bits):
+            results.append({
+                "input_bit": int(bit),
+                "alice_bits": (m0, m1),
+                "teleported_bit": teleported,
+                "success": teleported == bit,
+                "backend": self.backend_name
+            })
         return results
 
 # Flask app for web preview of pygame
@@ -237,6 +435,24 @@ def index():
     """
     return render_template_string(html)
 
+def _encode_frame_jpeg(raw, width, height):
+    """JPEG-encode one RGB frame already grabbed via pygame.image.tostring
+    (contiguous H x W x RGB bytes) — no Python-level transpose and no
+    surface lock held while encoding."""
+    arr = np.frombuffer(raw, dtype=np.uint8).reshape(height, width, 3)
+    if _TURBO is not None:
+        # Persistent encoder handle, one C call, no BytesIO
+        return _TURBO.encode(arr, quality=85, pixel_format=TJPF_RGB)
+    if cv2 is not None:
+        # cv2 wants BGR channel order
+        ok, buf = cv2.imencode('.jpg', arr[..., ::-1],
+                               [int(cv2.IMWRITE_JPEG_QUALITY), 85])
+        return buf.tobytes() if ok else b''
+    pil = Image.fromarray(arr)
+    out = io.BytesIO()
+    pil.save(out, format='JPEG', quality=85)
+    return out.getvalue()
+
 def mjpeg_generator():
     """
     Generator that yields multipart MJPEG frames by reading the pygame display surface.
@@ -247,20 +463,28 @@ def mjpeg_generator():
         return
 
     instance = FLASK_APP_INSTANCE
-    boundary = b'--frame'
+    last_hash = None
+    last_jpeg = b''
     while instance.running:
         try:
-            # Read pixels from the main screen surface
-            surf = instance.screen
-            arr = pygame.surfarray.array3d(surf)  # shape (width, height, 3)
-            # Convert to HxWx3
-            img = np.transpose(arr, (1, 0, 2))
-            pil = Image.fromarray(img)
-            buf = io.BytesIO()
-            pil.save(buf, format='JPEG', quality=85)
-            frame = buf.getvalue()
-
-            yield boundary + b'\r\n' + b'Content-Type: image/jpeg\r\n' + b'Content-Length: ' + str(len(frame)).encode() + b'\r\n\r\n' + frame + b'\r\n'
+            # One C-level copy of the frame; the dedup fingerprint and the
+            # encoder both work from these bytes, so the display surface is
+            # never locked from this thread while the main loop blits to it.
+            w, h = instance.screen.get_size()
+            raw = pygame.image.tostring(instance.screen, 'RGB')
+            # Sample every 64th byte: a mostly-static HUD means most frames
+            # can re-send the previous JPEG without re-encoding.
+            frame_hash = _frame_hash(raw[::64])
+            if frame_hash == last_hash and last_jpeg:
+                frame = last_jpeg
+            else:
+                frame = _encode_frame_jpeg(raw, w, h)
+                last_hash, last_jpeg = frame_hash, frame
+            # Single join instead of six bytes concatenations per frame
+            yield b''.join((b'--frame\r\n'
+                            b'Content-Type: image/jpeg\r\n'
+                            b'Content-Length: ', str(len(frame)).encode(),
+                            b'\r\n\r\n', frame, b'\r\n'))
             time.sleep(1.0 / max(1, FPS))
         except Exception as e:
             # If anything fails, yield a tiny pause and continue
@@ -271,11 +495,32 @@ def mjpeg_generator():
 def video_feed():
     return Response(mjpeg_generator(), mimetype='multipart/x-mixed-replace; boundary=frame')
 
+class _HotState:
+    """Per-frame hot scalars packed together; __slots__ makes each access a
+    fixed slot read instead of an instance-dict probe in update()/draw_*()."""
+    __slots__ = ('angle_y', 'scan_timer', 'entropy_control',
+                 'grounding_level', 'fidelity', 'dirty')
+
+    def __init__(self):
+        self.angle_y = 0.0
+        self.scan_timer = 0
+        self.entropy_control = 0.1
+        self.grounding_level = 0
+        self.fidelity = 0.0
+        self.dirty = True
+
 class HelloFriendEntropy:
     def __init__(self):
         pygame.init()
-        pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
-        
+        # Mixer init is optional: it can fail headless and is known to burn
+        # a CPU core on some Linux setups. Run silent if it won't come up.
+        try:
+            pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
+            self._mixer_ok = True
+        except pygame.error as e:
+            print("Mixer unavailable, running silent:", e)
+            self._mixer_ok = False
+
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("SYSTEM//:GROUNDING [DUPLEX LINK]")
         self.clock = pygame.time.Clock()
@@ -283,44 +528,89 @@ class HelloFriendEntropy:
         self.font_large = pygame.font.SysFont("monospace", 40)
         self.font_small = pygame.font.SysFont("monospace", 14)
 
-        # STATE
+        # STATE (hot per-frame scalars live together in _HotState)
+        self.hot = _HotState()
         self.protocol = "INIT: 0,0"
         self.status_msg = "SYSTEM: UNGROUNDED"
         self.access_granted = False
         self.is_scanning = False
-        self.scan_timer = 0
-        self.entropy_control = 0.1
-        self.grounding_level = 0
-        self.angle_y = 0.0
         self.running = True
         
-        # CHAT / LOGS
-        self.msg_log = ["SYSTEM READY...", "WAITING FOR UPLINK..."]
-        
-        # QUANTUM STATES (qutip)
-        ket0 = qt.basis(2, 0)
-        ket1 = qt.basis(2, 1)
-        self.target_state = (qt.tensor(ket0, ket1) - qt.tensor(ket1, ket0)).unit()
-        self.current_state = qt.tensor(qt.rand_ket(2), qt.rand_ket(2))
-        self.fidelity = 0.0
+        # CHAT / LOGS (maxlen evicts old lines in O(1), no list shifting)
+        self.msg_log = deque(["SYSTEM READY...", "WAITING FOR UPLINK..."], maxlen=8)
         
+        # QUANTUM STATES
+        # States are kept as plain complex128 ndarrays: shape (4,) kets or
+        # (4,4) density matrices. Qobj wrapping (dims validation, sparse
+        # bookkeeping) is avoided entirely in the per-frame path; the target
+        # is the fixed pure singlet so fidelity reduces to <psi-|rho|psi->.
+        self._psi_minus = np.array([0, 1, -1, 0], dtype=complex) / np.sqrt(2)
+        # Target projector hoisted here once; update() never recomputes it.
+        self.target_dm = np.outer(self._psi_minus, self._psi_minus.conj())
+        self.current_state = np.kron(_rand_ket2(), _rand_ket2())
+
         # VISUALS
-        self.stars = [(random.randint(0, WIDTH), random.randint(0, 300), random.random()) for _ in range(100)]
+        # Stars live in one (100, 3) float32 array (x, y, brightness) so the
+        # per-frame position math is a single vectorized pass.
+        self.stars = np.column_stack((
+            _RNG.integers(0, WIDTH, 100),
+            _RNG.integers(0, 300, 100),
+            _RNG.random(100),
+        )).astype(np.float32)
+        # Starfield layer, rendered once on first draw (sized to the rect)
+        # and scrolled by blit offset afterwards.
+        self._stars_surf = None
+        self._stars_rect = None
+        # Oscilloscope buffers are fixed per rect; cached on first draw and
+        # refilled in place each frame (no per-frame tuple lists).
+        self._osc_nx = None
+        self._osc_ones = None
+        self._osc_y = None
+        self._osc_pts = None
+        self._osc_rect = None
+        # Polygon vertex buffers, one per vertex count.
+        self._poly_buf = {}
+        # Frame cache: when state hasn't advanced (no scan, no grant, no new
+        # log lines) the previous frame is blitted back instead of redrawn.
+        self._last_frame = None
+        self._last_log_sig = None
+        # Rendered-text cache: rasterizing glyphs is one of the slowest
+        # per-frame ops and most HUD strings rarely change. FIFO-bounded.
+        self._text_cache = {}
+        # Structure-polygon angles, cached per vertex count.
+        self._poly_theta = {}
         
         # AUDIO
-        self.sound_sine = pygame.sndarray.make_sound(generate_sine_wave(440, 1.0, 0.3))
-        self.sound_noise = pygame.sndarray.make_sound(generate_noise(1.0, 0.2))
-        self.channel_tone = pygame.mixer.Channel(0)
-        self.channel_noise = pygame.mixer.Channel(1)
-        
-        self.channel_noise.play(self.sound_noise, loops=-1)
-        self.channel_noise.set_volume(0.8)
-        self.channel_tone.set_volume(0.0)
+        if self._mixer_ok:
+            self.sound_sine = pygame.sndarray.make_sound(generate_sine_wave(440, 1.0, 0.3))
+            self.sound_noise = pygame.sndarray.make_sound(generate_noise(1.0, 0.2))
+            self.channel_tone = pygame.mixer.Channel(0)
+            self.channel_noise = pygame.mixer.Channel(1)
+
+            self.channel_noise.play(self.sound_noise, loops=-1)
+            self.channel_noise.set_volume(0.8)
+            self.channel_tone.set_volume(0.0)
+        else:
+            self.sound_sine = self.sound_noise = None
+            self.channel_tone = self.channel_noise = None
 
         # NETWORK
-        self.host = '127.0.0.1' 
-        self.port = 65432       
+        self.host = '127.0.0.1'
+        self.port = 65432
         self.server_thread = None
+        # Heartbeats are pushed only when fidelity actually changes; the
+        # sender thread sleeps on this condition instead of polling.
+        self._fid_cv = threading.Condition()
+        self._fid_dirty = False
+        # Write end of the self-pipe used to wake the server's selector
+        # (set once the server thread is up).
+        self._wake_w = None
+        # Fixed 5-byte heartbeat frame: tag 0xF1 + little-endian float32.
+        # Packed in place so no str formatting or fresh bytes per beat.
+        self._heartbeat_buf = bytearray(5)
+        # Teleportation runs on this pool so the selector loop keeps reading
+        # while circuits simulate; results come back via done-callbacks.
+        self._teleport_pool = ThreadPoolExecutor(max_workers=2)
 
         # TELEPORTATION manager (Qiskit)
         self.teleporter = QTeleportationManager()
@@ -349,89 +639,158 @@ class HelloFriendEntropy:
         self.flask_thread.start()
         self.msg_log.append(f"FLASK: started on {host}:{port}")
 
-    def _listen_for_messages(self, conn):
-        """Separate thread to listen for incoming client messages"""
-        while self.running:
+    def _handle_frame(self, conn, frame):
+        """Handle one complete frame (type byte + body); replies are queued
+        on the send buffer."""
+        timestamp = time.strftime("%H:%M:%S")
+        if not frame:
+            return
+        body = memoryview(frame)[1:]
+        if frame[0] == FRAME_AUTH:
+            if len(body) < 32:
+                self.msg_log.append(f"[{timestamp}] MALFORMED MESSAGE")
+                self._queue_send(conn, b"MALFORMED")
+                return
+            # verify HMAC via the one-shot C entry point, straight over the
+            # frame memoryview — the payload is never copied or decoded here
+            mac_received = bytes(body[:32])
+            raw = body[32:]
+            mac_expected = hmac.digest(CLASSICAL_AUTH_SECRET, raw, "sha256")
+            if hmac.compare_digest(mac_expected, mac_received):
+                self.msg_log.append(f"[{timestamp}] AUTH OK. Teleporting payload ({len(raw)} bytes)...")
+                # Teleport on the worker pool; the reply is queued from
+                # the done-callback so this thread can keep reading.
+                fut = self._teleport_pool.submit(self.teleporter.teleport_bytes, bytes(raw))
+                fut.add_done_callback(
+                    lambda f, conn=conn: self._on_teleport_done(conn, f))
+            else:
+                self.msg_log.append(f"[{timestamp}] HMAC verification failed")
+                self._queue_send(conn, b"AUTH_FAILED")
+        elif frame[0] == FRAME_CHAT:
+            # Plain chat: log and respond with fidelity info
+            text = bytes(body).decode('utf-8', 'replace')
+            self.msg_log.append(f"[{timestamp}] REMOTE: {text}")
+            # send back fidelity as heartbeat
+            self._queue_send(conn, self._pack_heartbeat())
+        else:
+            self.msg_log.append(f"[{timestamp}] MALFORMED MESSAGE")
+            self._queue_send(conn, b"MALFORMED")
+
+    def _on_teleport_done(self, conn, fut):
+        """Pool callback: queue the teleport summary back to the sender."""
+        timestamp = time.strftime("%H:%M:%S")
+        try:
+            bit_results = fut.result()
+        except Exception as e:
+            self.msg_log.append(f"[{timestamp}] Teleport error: {e}")
+            bit_results = None
+
+        # Build response: return per-bit success summary and Alice bits for diagnostic
+        if bit_results is not None:
+            succ = sum(1 for r in bit_results if r["success"])
+            total = len(bit_results)
+            resp = f"TELEPORT_RESULT: success={succ}/{total} backend={self.teleporter.backend_name}"
+            self._queue_send(conn, resp.encode('utf-8'))
+            self.msg_log.append(f"[{timestamp}] {resp}")
+        else:
+            self._queue_send(conn, b"TELEPORT_FAILED")
+        self._wake_server()
+
+    def _wake_server(self):
+        """Nudge the server's selector so it re-checks self.running."""
+        if self._wake_w is not None:
+            try:
+                self._wake_w.send(b"\x00")
+            except OSError:
+                pass
+
+    def _queue_send(self, conn, payload):
+        """Append payload to a connection's send buffer; flushed on WRITE."""
+        buf = self._conn_bufs.get(conn)
+        if buf is None:
+            return
+        buf += payload
+        try:
+            self._sel.modify(conn, selectors.EVENT_READ | selectors.EVENT_WRITE, 'conn')
+        except (KeyError, ValueError):
+            pass
+
+    def _pack_heartbeat(self):
+        struct.pack_into("<Bf", self._heartbeat_buf, 0, 0xF1, self.hot.fidelity)
+        return bytes(self._heartbeat_buf)
+
+    def _stage_heartbeats(self):
+        """Queue a fidelity heartbeat on every connection if it changed."""
+        with self._fid_cv:
+            if not self._fid_dirty:
+                return
+            self._fid_dirty = False
+            payload = self._pack_heartbeat()
+        for conn in list(self._conn_bufs):
+            self._queue_send(conn, payload)
+
+    def _close_connection(self, conn):
+        self.msg_log.append("UPLINK LOST.")
+        try:
+            self._sel.unregister(conn)
+        except (KeyError, ValueError):
+            pass
+        self._conn_bufs.pop(conn, None)
+        self._conn_rx.pop(conn, None)
+        conn.close()
+
+    def _service_connection(self, conn, mask):
+        if mask & selectors.EVENT_READ:
             try:
-                data = conn.recv(4096)
-                if not data:
-                    break
+                data = conn.recv(65536)
+            except BlockingIOError:
+                data = None
+            except OSError:
+                data = b""
+            if data == b"":
+                self._close_connection(conn)
+                return
+            if data:
+                # Reassemble length-prefixed frames from the per-connection
+                # buffer; partial frames just wait for the next recv.
+                rx = self._conn_rx[conn]
+                rx += data
+                while len(rx) >= 4:
+                    n = struct.unpack_from("<I", rx)[0]
+                    if n > MAX_FRAME_SIZE:
+                        self._close_connection(conn)
+                        return
+                    if len(rx) < 4 + n:
+                        break
+                    frame = bytes(rx[4:4 + n])
+                    del rx[:4 + n]
+                    self._handle_frame(conn, frame)
+        if mask & selectors.EVENT_WRITE:
+            buf = self._conn_bufs.get(conn)
+            if buf:
                 try:
-                    decoded = data.decode('utf-8')
-                except:
-                    decoded = None
-
-                timestamp = time.strftime("%H:%M:%S")
-                # Expecting messages in the form: MESSAGE:<b64_payload>|HMAC:<hex>
-                if decoded and "|HMAC:" in decoded:
-                    parts = decoded.split("|HMAC:", 1)
-                    payload_part = parts[0]
-                    hmac_part = parts[1] if len(parts) > 1 else ""
-                    if payload_part.startswith("MESSAGE:"):
-                        b64payload = payload_part.split("MESSAGE:", 1)[1]
-                        try:
-                            raw = base64.b64decode(b64payload)
-                            # verify HMAC
-                            mac_received = bytes.fromhex(hmac_part.strip())
-                            mac_expected = hmac.new(CLASSICAL_AUTH_SECRET, raw, hashlib.sha256).digest()
-                            if hmac.compare_digest(mac_expected, mac_received):
-                                self.msg_log.append(f"[{timestamp}] AUTH OK. Teleporting payload ({len(raw)} bytes)...")
-                                # Teleport bytes sequentially (this can be slow; consider batching)
-                                try:
-                                    bit_results = self.teleporter.teleport_bytes(raw)
-                                except Exception as e:
-                                    self.msg_log.append(f"[{timestamp}] Teleport error: {e}")
-                                    bit_results = None
-
-                                # Build response: return per-bit success summary and Alice bits for diagnostic
-                                if bit_results is not None:
-                                    succ = sum(1 for r in bit_results if r["success"])
-                                    total = len(bit_results)
-                                    resp = f"TELEPORT_RESULT: success={succ}/{total} backend={self.teleporter.backend_name}"
-                                    try:
-                                        conn.sendall(resp.encode('utf-8'))
-                                    except Exception:
-                                        pass
-                                    self.msg_log.append(f"[{timestamp}] {resp}")
-                                else:
-                                    try:
-                                        conn.sendall(b"TELEPORT_FAILED")
-                                    except Exception:
-                                        pass
-                            else:
-                                self.msg_log.append(f"[{timestamp}] HMAC verification failed")
-                                try:
-                                    conn.sendall(b"AUTH_FAILED")
-                                except Exception:
-                                    pass
-                        except Exception as e:
-                            self.msg_log.append(f"[{timestamp}] Payload decode failed: {e}")
-                            try:
-                                conn.sendall(b"BAD_PAYLOAD")
-                            except Exception:
-                                pass
-                    else:
-                        self.msg_log.append(f"[{timestamp}] MALFORMED MESSAGE")
-                        try:
-                            conn.sendall(b"MALFORMED")
-                        except Exception:
-                            pass
-                else:
-                    # Plain text fallback: log and respond with fidelity info
-                    text = decoded if decoded else repr(data)
-                    self.msg_log.append(f"[{timestamp}] REMOTE: {text}")
-                    if len(self.msg_log) > 8:  # Keep only last 8 messages
-                        self.msg_log.pop(0)
-                    # send back fidelity as heartbeat
-                    data_string = f"FIDELITY:{self.fidelity:.4f}\n"
-                    try:
-                        conn.sendall(data_string.encode('utf-8'))
-                    except Exception:
-                        pass
-            except Exception:
-                break
+                    sent = conn.send(buf)
+                    del buf[:sent]
+                except BlockingIOError:
+                    pass
+                except OSError:
+                    self._close_connection(conn)
+                    return
+            if not buf:
+                try:
+                    self._sel.modify(conn, selectors.EVENT_READ, 'conn')
+                except (KeyError, ValueError):
+                    pass
 
     def _run_server(self):
+        # Single-threaded event loop: the listening socket, the self-pipe
+        # and every client connection (both recv and send sides) are
+        # multiplexed on one selector (epoll on Linux). No per-connection
+        # threads, no timeout polling.
+        sel = selectors.DefaultSelector()
+        self._sel = sel
+        self._conn_bufs = {}
+        self._conn_rx = {}
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
             s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
@@ -442,34 +801,57 @@ class HelloFriendEntropy:
                 return
 
             s.listen()
-            
-            while self.running:
-                try:
-                    s.settimeout(1.0)
-                    try:
-                        conn, addr = s.accept()
-                    except socket.timeout:
-                        continue
-                        
-                    with conn:
-                        self.msg_log.append(f"UPLINK ESTABLISHED: {addr[0]}")
-                        
-                        # Start a thread to LISTEN to the client
-                        listener = threading.Thread(target=self._listen_for_messages, args=(conn,))
-                        listener.daemon = True
-                        listener.start()
-
-                        # Main loop SENDS to the client
-                        while self.running:
-                            data_string = f"FIDELITY:{self.fidelity:.4f}\n"
+            s.setblocking(False)
+            sel.register(s, selectors.EVENT_READ, 'accept')
+
+            wake_r, wake_w = socket.socketpair()
+            wake_r.setblocking(False)
+            self._wake_w = wake_w
+            sel.register(wake_r, selectors.EVENT_READ, 'wake')
+
+            try:
+                while self.running:
+                    for key, mask in sel.select(timeout=None):
+                        if key.data == 'wake':
+                            wake_r.recv(4096)
+                        elif key.data == 'accept':
                             try:
-                                conn.sendall(data_string.encode('utf-8'))
-                                time.sleep(0.2)
-                            except Exception:
-                                self.msg_log.append("UPLINK LOST.")
-                                break
-                except Exception as e:
-                    print(f"Server error: {e}")
+                                conn, addr = s.accept()
+                            except OSError as e:
+                                print(f"Server error: {e}")
+                                continue
+                            self.msg_log.append(f"UPLINK ESTABLISHED: {addr[0]}")
+                            conn.setblocking(False)
+                            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                            self._conn_bufs[conn] = bytearray()
+                            self._conn_rx[conn] = bytearray()
+                            sel.register(conn, selectors.EVENT_READ, 'conn')
+                        else:
+                            self._service_connection(key.fileobj, mask)
+                    self._stage_heartbeats()
+            finally:
+                self._wake_w = None
+                for conn in list(self._conn_bufs):
+                    self._close_connection(conn)
+                wake_r.close()
+                wake_w.close()
+                sel.close()
+
+    def _publish_fidelity(self, value):
+        """Update fidelity and wake the server loop to stage heartbeats."""
+        with self._fid_cv:
+            self.hot.fidelity = value
+            self._fid_dirty = True
+        self.hot.dirty = True
+        self._wake_server()
+
+    def _fidelity_to_target(self, state):
+        """Fidelity against the pure singlet target: <psi-|rho|psi-> for a
+        density matrix, |<psi-|ket>|^2 for a ket. One matvec + inner product
+        instead of QuTiP's sqrt-matrix eigendecomposition."""
+        if state.ndim == 1:
+            return float(abs(np.vdot(self._psi_minus, state)) ** 2)
+        return float(np.real(np.vdot(self._psi_minus, state @ self._psi_minus)))
 
     def cycle_protocol(self):
         if self.is_scanning: return
@@ -479,59 +861,189 @@ class HelloFriendEntropy:
         else:
             self.protocol = "INIT: 0,1"
             self.status_msg = "SYSTEM: UNGROUNDED"
-            self.current_state = qt.tensor(qt.rand_ket(2), qt.rand_ket(2))
+            self.current_state = np.kron(_rand_ket2(), _rand_ket2())
         self.is_scanning = True
         self.access_granted = False
-        self.scan_timer = 0
-        self.entropy_control = 0.1
-        self.grounding_level = 0
-        self.fidelity = 0.0
-        self.channel_noise.set_volume(0.8)
-        self.channel_tone.set_volume(0.0)
+        self.hot.dirty = True
+        self.hot.scan_timer = 0
+        self.hot.entropy_control = 0.1
+        self.hot.grounding_level = 0
+        self._publish_fidelity(0.0)
+        if self._mixer_ok:
+            self.channel_noise.set_volume(0.8)
+            self.channel_tone.set_volume(0.0)
 
     def update(self):
-        self.angle_y += 0.02
+        h = self.hot
+        h.angle_y += 0.02
         if self.is_scanning:
-            self.scan_timer += 1
+            h.scan_timer += 1
             if self.protocol == "GROUNDING: 0,1 -- 1,0":
-                if self.scan_timer % 5 == 0:
-                    dm_curr = self.current_state.proj() if self.current_state.isket else self.current_state
-                    dm_targ = self.target_state.proj()
-                    mix = min(1.0, self.scan_timer / 100.0)
-                    self.current_state = (1 - mix) * dm_curr + mix * dm_targ
-                    self.fidelity = qt.fidelity(self.current_state, self.target_state)
-                    self.entropy_control = self.fidelity 
+                if h.scan_timer % 5 == 0:
+                    if self.current_state.ndim == 1:
+                        dm_curr = np.outer(self.current_state, self.current_state.conj())
+                    else:
+                        dm_curr = self.current_state
+                    mix = min(1.0, h.scan_timer / 100.0)
+                    self.current_state = (1 - mix) * dm_curr + mix * self.target_dm
+                    self._publish_fidelity(self._fidelity_to_target(self.current_state))
+                    h.entropy_control = h.fidelity
             else:
-                if self.scan_timer % 10 == 0:
-                    self.current_state = qt.tensor(qt.rand_ket(2), qt.rand_ket(2))
-                    self.fidelity = qt.fidelity(self.current_state, self.target_state)
-            if self.scan_timer > 100:
+                if h.scan_timer % 10 == 0:
+                    self.current_state = np.kron(_rand_ket2(), _rand_ket2())
+                    self._publish_fidelity(self._fidelity_to_target(self.current_state))
+            if h.scan_timer > 100:
                 self.check_clearance()
                 self.is_scanning = False
 
     def check_clearance(self):
-        d(self):
+        if self.hot.fidelity > 0.95:
+            self.hot.grounding_level = 2
+            self.access_granted = True
+            self.hot.entropy_control = 1.0
+            self.status_msg = "SYSTEM: GROUNDED"
+            if self._mixer_ok:
+                self.channel_noise.set_volume(0.0)
+                self.channel_tone.play(self.sound_sine, loops=-1)
+                self.channel_tone.set_volume(0.5)
+        else:
+            self.hot.grounding_level = 0
+            self.access_granted = False
+            self.hot.entropy_control = 0.1
+            self.status_msg = "SYSTEM: UNGROUNDED"
+            if self._mixer_ok:
+                self.channel_tone.stop()
+                self.channel_noise.set_volume(0.8)
+
+    def _render_cached(self, font, text, color):
+        key = (id(font), text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 128:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            surf = font.render(text, True, color)
+            self._text_cache[key] = surf
+        return surf
+
+    def draw_top_screen(self, surface, rect):
+        h = self.hot
+        pygame.draw.rect(surface, (0, 10, 0), rect)
+        pygame.draw.rect(surface, HUD_COLOR, rect, 2)
+
+        clip_rect = surface.get_clip()
+        surface.set_clip(rect)
+
+        # Starfield: the stars never change, only scroll — so they're plotted
+        # once onto an alpha layer and replayed as two wrapped blits per
+        # frame instead of recomputing/writing 100 pixels.
+        if self._stars_rect != (rect.width, rect.height):
+            sw, sh = rect.width - 4, rect.height - 4
+            layer = pygame.Surface((sw, sh), pygame.SRCALPHA)
+            for x, y, b in self.stars:
+                c = int(b * 255)
+                layer.set_at((int(x) % sw, int(y) % sh), (c, c, c))
+            self._stars_surf = layer
+            self._stars_rect = (rect.width, rect.height)
+        sw = rect.width - 4
+        off = int(h.angle_y * 10) % sw
+        surface.set_clip(rect.inflate(-4, -4))
+        surface.blit(self._stars_surf, (rect.x + 2 + off - sw, rect.y + 2))
+        surface.blit(self._stars_surf, (rect.x + 2 + off, rect.y + 2))
+        surface.set_clip(rect)
+
+        # Central structure: jitter collapses as the entropy control rises.
+        # All vertices come from one vectorized draw over cached angles.
+        cx, cy = rect.centerx, rect.centery
+        points_count = 6 if h.grounding_level == 2 else 12
+        radius = 80
+        theta = self._poly_theta.get(points_count)
+        if theta is None:
+            theta = np.arange(points_count, dtype=np.float32) * (2 * np.pi / points_count)
+            self._poly_theta[points_count] = theta
+        # Native float32 draw: no float64 intermediate to downcast
+        jitter = (_RNG.random(points_count, dtype=np.float32) * 2.0 - 1.0) \
+            * ((1 - h.entropy_control) * 20)
+        pts = self._poly_buf.get(points_count)
+        if pts is None:
+            pts = np.empty((points_count, 2), dtype=np.float32)
+            self._poly_buf[points_count] = pts
+        _polygon_xy(theta, float(cx), float(cy), float(radius), jitter, float(h.angle_y), pts)
+        struct_col = ACCENT_COLOR if self.access_granted else HUD_COLOR
+        pygame.draw.polygon(surface, struct_col, pts.tolist(), 2)
+
+        surface.set_clip(clip_rect)
+        lbl = self._render_cached(self.font_small, "VISUAL::STRUCTURE", (0, 100, 0))
+        surface.blit(lbl, (rect.x + 5, rect.y + 5))
+
+    def draw_oscilloscope(self, surface, rect):
+        h = self.hot
+        pygame.draw.rect(surface, (0, 0, 0), rect)
+        pygame.draw.rect(surface, HUD_COLOR, rect, 2)
+        cx, cy = rect.centerx, rect.centery
+
+        # One vectorized np.sin over the cached x buffer replaces ~500
+        # per-sample math.sin / random.uniform calls per frame.
+        if self._osc_rect != (rect.x, rect.right):
+            xs = np.arange(rect.x, rect.right, 2, dtype=np.float32)
+            self._osc_nx = (xs - rect.x) / rect.width
+            self._osc_ones = np.ones_like(xs)
+            self._osc_y = np.empty_like(xs)
+            self._osc_pts = np.empty((xs.shape[0], 2), dtype=np.int32)
+            self._osc_pts[:, 0] = xs
+            self._osc_rect = (rect.x, rect.right)
+        nx = self._osc_nx
+
+        if self.access_granted:
+            _osc_wave(nx, float(cy), 20.0, h.angle_y * 10, 50.0, self._osc_ones, self._osc_y)
+            color = ACCENT_COLOR
+        else:
+            amp = 20.0 + h.entropy_control * 30
+            noise = _RNG.random(nx.shape[0], dtype=np.float32)
+            _osc_wave(nx, float(cy), 100.0, h.angle_y * 5, amp, noise, self._osc_y)
+            color = (50, 50, 50)
+
+        self._osc_pts[:, 1] = self._osc_y
+        if self._osc_pts.shape[0] > 1:
+            pygame.draw.lines(surface, color, False, self._osc_pts.tolist(), 2)
+
+        lbl = self._render_cached(self.font_small, "AUDIO::SPECTRUM", (0, 100, 0))
+        surface.blit(lbl, (rect.x + 5, rect.y + 5))
+
+    def draw_hud(self):
         status_color = HUD_COLOR if self.access_granted else ALERT_COLOR
-        lbl_status = self.font_large.render(self.status_msg, True, status_color)
+        lbl_status = self._render_cached(self.font_large, self.status_msg, status_color)
         self.screen.blit(lbl_status, (20, HEIGHT - 50))
 
-        lbl_protocol = self.font_main.render(f"PROTOCOL: {self.protocol}", True, HUD_COLOR)
+        lbl_protocol = self._render_cached(self.font_main, f"PROTOCOL: {self.protocol}", HUD_COLOR)
         self.screen.blit(lbl_protocol, (WIDTH - lbl_protocol.get_width() - 20, 20))
-        
-        # DRAW MESSAGE LOG
+
+        # DRAW MESSAGE LOG (cached per line, so only new lines rasterize).
+        # Snapshot the deque: the server thread and teleport callbacks
+        # append to it, and deques raise if mutated mid-iteration.
         start_y = 380
-        for i, msg in enumerate(self.msg_log):
-            txt = self.font_small.render(msg, True, (0, 255, 0))
+        for i, msg in enumerate(tuple(self.msg_log)):
+            txt = self._render_cached(self.font_small, msg, (0, 255, 0))
             self.screen.blit(txt, (20, start_y + (i * 20)))
 
     def draw(self):
+        # Skip the heavy panel redraw when nothing perceptible changed.
+        log_sig = (len(self.msg_log), self.msg_log[-1] if self.msg_log else None)
+        idle = not (self.hot.dirty or self.is_scanning or self.access_granted)
+        if idle and self._last_frame is not None and log_sig == self._last_log_sig:
+            self.screen.blit(self._last_frame, (0, 0))
+            pygame.display.flip()
+            return
+        self.hot.dirty = False
+        self._last_log_sig = log_sig
+
         self.screen.fill(BG_COLOR)
         top_rect = pygame.Rect(10, 10, WIDTH - 20, 350)
         bottom_rect = pygame.Rect(10, 370, WIDTH - 20, 250)
-        
+
         self.draw_top_screen(self.screen, top_rect)
         self.draw_oscilloscope(self.screen, bottom_rect)
         self.draw_hud()
+        self._last_frame = self.screen.copy()
         pygame.display.flip()
 
     def handle_events(self):
@@ -552,8 +1064,10 @@ class HelloFriendEntropy:
             self.update()
             self.draw()
             self.clock.tick(FPS)
-        
-        pygame.mixer.quit()
+
+        self._wake_server()
+        if self._mixer_ok:
+            pygame.mixer.quit()
         pygame.quit()
 
 if __name__ == '__main__':
@@ -1,4 +1,5 @@
 import socket
+import struct
 import time
 import sys
 import threading
@@ -12,35 +13,49 @@ print("Enter commands to transmit to Grounding Station.")
 # Shared flag to kill threads on exit
 running = True
 
+HEARTBEAT_TAG = 0xF1  # 5-byte frame: tag + little-endian float32 fidelity
+FRAME_CHAT = 0x02     # outgoing: <I length> + type byte + UTF-8 text
+
+def send_chat(sock, text):
+    """Send a length-prefixed chat frame (survives TCP fragmentation)."""
+    body = bytes([FRAME_CHAT]) + text.encode('utf-8')
+    sock.sendall(struct.pack("<I", len(body)) + body)
+
 def receive_stream(sock):
     """Background thread to handle incoming fidelity data"""
     global running
+    buf = bytearray()
     while running:
         try:
-            data = sock.recv(1024).decode('utf-8')
+            data = sock.recv(1024)
             if not data:
                 print("\n>> DISCONNECTED FROM SOURCE")
                 running = False
                 break
-            
-            # Look for FIDELITY data
-            lines = data.strip().split('\n')
-            for line in lines:
-                if "FIDELITY" in line:
-                    try:
-                        val_str = line.split(':')[1]
-                        val = float(val_str)
-                        
-                        bar_len = 20
-                        filled = int(val * bar_len)
-                        bar = "█" * filled + "-" * (bar_len - filled)
-                        
-                        # Print status bar on the current line
-                        # Note: This might overlap slightly with typing, which is typical for raw terminals
-                        sys.stdout.write(f"\r[LINK ACTIVE] {bar} {val:.4f} | >> ")
-                        sys.stdout.flush()
-                    except:
-                        pass
+            buf += data
+
+            while buf:
+                if buf[0] == HEARTBEAT_TAG:
+                    if len(buf) < 5:
+                        break  # partial frame, wait for more bytes
+                    val = struct.unpack_from("<f", buf, 1)[0]
+                    del buf[:5]
+
+                    bar_len = 20
+                    filled = int(val * bar_len)
+                    bar = "█" * filled + "-" * (bar_len - filled)
+
+                    # Print status bar on the current line
+                    # Note: This might overlap slightly with typing, which is typical for raw terminals
+                    sys.stdout.write(f"\r[LINK ACTIVE] {bar} {val:.4f} | >> ")
+                    sys.stdout.flush()
+                else:
+                    # Plain-text server response: print through to next frame
+                    cut = buf.find(bytes([HEARTBEAT_TAG]))
+                    chunk = bytes(buf[:cut]) if cut != -1 else bytes(buf)
+                    del buf[:len(chunk)]
+                    sys.stdout.write("\n>> " + chunk.decode('utf-8', 'replace') + "\n")
+                    sys.stdout.flush()
         except:
             break
 
@@ -60,7 +75,7 @@ try:
             if user_msg.lower() == 'exit':
                 running = False
                 break
-            s.sendall(user_msg.encode('utf-8'))
+            send_chat(s, user_msg)
             
 except KeyboardInterrupt:
     print("\n>> TERMINATING UPLINK")
@@ -1,12 +1,13 @@
 import pygame
 import numpy as np
-import math
 import random
-import qutip as qt  # Quantum Toolbox in Python
+import functools
+from concurrent.futures import ThreadPoolExecutor
 
 # --- CONFIGURATION ---
 WIDTH, HEIGHT = 1000, 700
 FPS = 60
+SIM_DT = 1 / 20  # quantum-evolution tick; rendering stays at FPS
 BG_COLOR = (5, 5, 10) # Darker for high contrast
 HUD_COLOR = (0, 255, 0)
 ACCENT_COLOR = (0, 200, 200)
@@ -16,26 +17,103 @@ HORIZON_COLOR = (255, 215, 0) # Gold for the 2**80 Event
 # --- AUDIO ENGINE ---
 SAMPLE_RATE = 44100
 
+# Shared PCG64 generator; noticeably faster than the legacy np.random API.
+_RNG = np.random.default_rng()
+
+def _rand_ket2(rng=_RNG):
+    """Haar-random single-qubit ket as a plain length-2 complex ndarray."""
+    v = rng.standard_normal(2) + 1j * rng.standard_normal(2)
+    return v / np.linalg.norm(v)
+
+def _log2(x):
+    """floor(log2(x)) via integer bit_length — no FPU call, exact for the
+    huge complexity counts math.log would round through a float64."""
+    xi = int(x)
+    return xi.bit_length() - 1 if xi > 0 else 0
+
+# Per-frame oscilloscope kernel, filling a caller-owned buffer so no
+# allocation happens per frame. The NumPy version is the fallback; when
+# numba is installed it is replaced by a JIT-compiled loop.
+def _osc_wave(nx, cy, freq, phase, amp, noise, out):
+    np.sin(nx * freq + phase, out=out)
+    out *= amp
+    out *= noise
+    out += cy
+
+try:
+    import numba
+
+    @numba.njit(cache=True, fastmath=True)
+    def _osc_wave(nx, cy, freq, phase, amp, noise, out):
+        for i in range(nx.shape[0]):
+            out[i] = cy + np.sin(nx[i] * freq + phase) * amp * noise[i]
+except ImportError:
+    pass
+
+def _to_stereo(audio):
+    """Duplicate a mono int16 buffer into two contiguous channels with one
+    column assignment each — no intermediate view materialization."""
+    stereo = np.empty((audio.shape[0], 2), dtype=np.int16)
+    stereo[:, 0] = audio
+    stereo[:, 1] = audio
+    return stereo
+
+# Both generators are pure functions of their arguments, so each buffer is
+# rendered exactly once and replayed from the cache on any regeneration.
+@functools.lru_cache(maxsize=8)
 def generate_sine_wave(freq, duration, volume=0.5):
     t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False)
     wave = np.sin(freq * 2 * np.pi * t)
     audio = (wave * volume * 32767).astype(np.int16)
-    return np.column_stack((audio, audio))
+    return _to_stereo(audio)
 
+@functools.lru_cache(maxsize=4)
 def generate_complex_noise(duration):
     # Generates a dense, heavy "computational" noise
-    t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False)
-    # Layering multiple frequencies to simulate complexity
-    noise = np.sin(50 * 2 * np.pi * t) + np.sin(100 * 2 * np.pi * t) + np.random.uniform(-0.5, 0.5, len(t))
-    audio = (noise * 0.1 * 32767).astype(np.int16)
-    return np.column_stack((audio, audio))
+    t = np.linspace(0, duration, int(SAMPLE_RATE * duration), False,
+                    dtype=np.float32)
+    # Layering multiple frequencies to simulate complexity: one broadcasted
+    # sin over an (n, 2) phase grid, evaluated in place and summed — no
+    # per-frequency float64 temporaries.
+    freqs = np.array([50.0, 100.0], dtype=np.float32) * (2 * np.pi)
+    phases = t[:, None] * freqs
+    np.sin(phases, out=phases)
+    noise = phases.sum(axis=1)
+    noise += _RNG.random(len(t), dtype=np.float32)
+    noise -= 0.5
+    audio = (noise * (0.1 * 32767)).astype(np.int16)
+    return _to_stereo(audio)
 
 # --- MAIN APP CLASS ---
 class HelloFriendEntropy:
+    # Fixed attribute slots: every per-frame self.* access becomes an
+    # offset load instead of a dict probe.
+    __slots__ = (
+        'screen', 'clock', 'font_main', 'font_large', 'font_small',
+        'font_micro', '_text_cache', '_horizon_msg', 'protocol',
+        'status_msg', 'access_granted', 'is_scanning', 'scan_timer',
+        'entropy_control', 'grounding_level', 'angle_y', 'horizon_limit',
+        'current_complexity', 'bars', 'target_psi', 'target_proj',
+        'current_state', 'fidelity', 'stars', '_stars_layer',
+        'matrix_rain', 'n_drops', '_rain_glyphs', '_osc_nx', '_osc_ones',
+        '_osc_y', '_osc_pts', '_osc_idx', '_osc_rect', '_osc_xloc',
+        '_sig_layer', '_noise_lut',
+        '_sim_acc', '_top_bg', '_osc_bg', '_bloch_bg', 'sound_sine', 'sound_horizon',
+        'sound_noise', 'channel_tone', 'channel_noise',
+    )
+
     def __init__(self):
         pygame.init()
         pygame.mixer.init(frequency=SAMPLE_RATE, size=-16, channels=2, buffer=512)
-        
+
+        # Synthesize the audio buffers on worker threads while the display
+        # and fonts come up — np.sin releases the GIL, so this overlaps
+        # with the SDL setup below instead of serializing behind it.
+        audio_pool = ThreadPoolExecutor(max_workers=2)
+        f_sine = audio_pool.submit(generate_sine_wave, 440, 1.0, 0.3)
+        f_horizon = audio_pool.submit(generate_sine_wave, 55, 1.0, 0.4)
+        f_noise = audio_pool.submit(generate_complex_noise, 1.0)
+
         self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("SYSTEM//:HORIZON [2**80]")
         self.clock = pygame.time.Clock()
@@ -44,6 +122,25 @@ class HelloFriendEntropy:
         self.font_small = pygame.font.SysFont("monospace", 12)
         self.font_micro = pygame.font.SysFont("monospace", 10)
 
+        # Rendered-text cache: SDL_ttf rasterization is one of the heaviest
+        # per-frame ops and nearly every label here is static or bucketed.
+        # FIFO-bounded so dynamic strings can't grow it without limit.
+        self._text_cache = {}
+        # Pre-warm the fully static labels so first-frame cost is flat.
+        for font, s, color in (
+            (self.font_small, "COMPUTATIONAL_HORIZON", (0, 100, 0)),
+            (self.font_small, "SIGNAL::ENTROPY_DENSITY", (0, 100, 0)),
+            (self.font_small, "QUANTUM_STATE", ACCENT_COLOR),
+            (self.font_small, "SEARCHING HILBERT SPACE", (100, 100, 100)),
+            (self.font_large, "HELLO FRIEND", HUD_COLOR),
+            (self.font_large, "SYSTEM//:HORIZON_LIMIT", HUD_COLOR),
+            (self.font_micro, "0", (0, 100, 0)),
+            (self.font_micro, "1", (0, 100, 0)),
+        ):
+            self._text(font, s, color)
+        # The scaled-to-fit horizon number, built on first grounded frame.
+        self._horizon_msg = None
+
         # STATE
         self.protocol = "INIT: 0"
         self.status_msg = "SYSTEM: IDLE"
@@ -57,25 +154,61 @@ class HelloFriendEntropy:
         # THE MAGIC NUMBER
         self.horizon_limit = 2**80
         self.current_complexity = 0
+        self.bars = 0  # floor(log2(complexity)), shared by the draw methods
+        self._sim_acc = 0.0  # accumulated wall time owed to the sim tick
         
         # QUANTUM STATE
-        # We start with a standard qubit. 
-        # The 2**80 isn't representable in QuTiP directly (memory overflow), 
-        # so we simulate the *result* of that calculation collapsing.
-        ket0 = qt.basis(2, 0)
-        ket1 = qt.basis(2, 1)
-        self.target_state = (qt.tensor(ket0, ket1) - qt.tensor(ket1, ket0)).unit()
-        self.current_state = qt.tensor(qt.rand_ket(2), qt.rand_ket(2))
+        # We start with a standard qubit.
+        # The 2**80 isn't representable directly (memory overflow), so we
+        # simulate the *result* of that calculation collapsing. States are
+        # plain complex128 ndarrays — shape (4,) kets or (4,4) density
+        # matrices — so each tick is a handful of O(16)-element numpy ops
+        # with no Qobj metadata or sparse-dense dispatch in between.
+        self.target_psi = np.array([0, 1, -1, 0], dtype=np.complex128) / np.sqrt(2)
+        self.target_proj = np.outer(self.target_psi, self.target_psi.conj())
+        self.current_state = self._random_dm()
         self.fidelity = 0.0
         
         # VISUAL ASSETS
+        # Starfield painted once onto an alpha layer; per-frame cost is a
+        # single blit rather than 150 individual pixel draws.
         self.stars = [(random.randint(0, WIDTH), random.randint(0, 300), random.random()) for _ in range(150)]
-        self.matrix_rain = [] # For the 2**80 flood
+        self._stars_layer = pygame.Surface((WIDTH, 300), pygame.SRCALPHA)
+        for x, y, b in self.stars:
+            c = int(b * 255)
+            self._stars_layer.set_at((min(x, WIDTH - 1), min(y, 299)), (c, c, c))
+        self._stars_layer = self._stars_layer.convert_alpha()
+        # Matrix rain for the 2**80 flood: one (100, 3) int32 array of
+        # x / y / speed columns, ramped in via n_drops and advanced with
+        # vectorized column ops instead of a Python list-of-lists loop.
+        self.matrix_rain = np.empty((100, 3), dtype=np.int32)
+        self.n_drops = 0
+        # The rain only ever shows "0" or "1": two cached glyphs, batch-blitted.
+        self._rain_glyphs = (self._text(self.font_micro, "0", (0, 100, 0)),
+                             self._text(self.font_micro, "1", (0, 100, 0)))
+        # Oscilloscope buffers are fixed per rect; cached on first draw and
+        # refilled in place each frame (no per-frame tuple lists).
+        self._osc_nx = None
+        self._osc_ones = None
+        self._osc_y = None
+        self._osc_pts = None
+        self._osc_rect = None
+        # Colorkeyed strip the waveform pixels are written onto each frame.
+        self._sig_layer = None
+        # Pre-rolled noise ring for the chaos trace: indexed with a moving
+        # phase instead of drawing ~300 fresh randoms per frame.
+        self._noise_lut = _RNG.random(4096).astype(np.float32)
+        # Static panel chrome (fill + border + sphere outlines), rendered
+        # once on first draw and replayed as a single blit per frame.
+        self._top_bg = None
+        self._osc_bg = None
+        self._bloch_bg = None
         
-        # AUDIO OBJECTS
-        self.sound_sine = pygame.sndarray.make_sound(generate_sine_wave(440, 1.0, 0.3))
-        self.sound_horizon = pygame.sndarray.make_sound(generate_sine_wave(55, 1.0, 0.4)) # Low drone
-        self.sound_noise = pygame.sndarray.make_sound(generate_complex_noise(1.0))
+        # AUDIO OBJECTS (join the startup synthesis jobs)
+        self.sound_sine = pygame.sndarray.make_sound(f_sine.result())
+        self.sound_horizon = pygame.sndarray.make_sound(f_horizon.result()) # Low drone
+        self.sound_noise = pygame.sndarray.make_sound(f_noise.result())
+        audio_pool.shutdown()
         
         self.channel_tone = pygame.mixer.Channel(0)
         self.channel_noise = pygame.mixer.Channel(1)
@@ -83,6 +216,26 @@ class HelloFriendEntropy:
         self.channel_noise.play(self.sound_noise, loops=-1)
         self.channel_noise.set_volume(0.8)
 
+    @staticmethod
+    def _random_dm():
+        """Random product state, promoted to a density matrix up front so
+        update() never has to branch on ket vs operator."""
+        psi = np.kron(_rand_ket2(), _rand_ket2())
+        return np.outer(psi, psi.conj())
+
+    def _text(self, font, s, color):
+        """Memoized font.render: rasterize each (font, string, color) once."""
+        key = (id(font), s, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            if len(self._text_cache) >= 128:
+                self._text_cache.pop(next(iter(self._text_cache)))
+            # convert_alpha matches the display format so blits skip the
+            # per-call pixel reformat SDL does for raw render output
+            surf = font.render(s, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+
     def cycle_protocol(self):
         if self.is_scanning: return
 
@@ -92,7 +245,7 @@ class HelloFriendEntropy:
         else:
             self.protocol = "INIT: 0"
             self.status_msg = "SYSTEM: IDLE"
-            self.current_state = qt.tensor(qt.rand_ket(2), qt.rand_ket(2))
+            self.current_state = self._random_dm()
             
         self.is_scanning = True
         self.access_granted = False
@@ -105,40 +258,59 @@ class HelloFriendEntropy:
         self.channel_noise.set_volume(0.8)
         self.channel_tone.set_volume(0.0)
 
-    def update(self):
+    def update(self, dt):
         self.angle_y += 0.02
+        self.bars = _log2(self.current_complexity)
+
+        # Quantum evolution runs on its own fixed 20 Hz clock, decoupled
+        # from render FPS: accumulate wall time and tick as many times as
+        # are owed (usually 0 or 1 per frame).
+        self._sim_acc += dt
+        while self._sim_acc >= SIM_DT:
+            self._sim_acc -= SIM_DT
+            self._sim_tick()
 
-        if self.is_scanning:
-            self.scan_timer += 1
-            
-            # SIMULATING THE CLIMB TO 2**80
-            if self.protocol == f"HORIZON: 2^{{80}}":
-                # Exponential growth simulation
-                self.current_complexity = min(self.horizon_limit, 2**(self.scan_timer * 0.8))
-                
-                # QuTiP Evolution
-                if self.scan_timer % 5 == 0:
-                    dm_curr = self.current_state.proj() if self.current_state.isket else self.current_state
-                    dm_targ = self.target_state.proj()
-                    mix = min(1.0, self.scan_timer / 120.0)
-                    self.current_state = (1 - mix) * dm_curr + mix * dm_targ
-                    self.fidelity = qt.fidelity(self.current_state, self.target_state)
-                    self.entropy_control = self.fidelity
-
-            if self.scan_timer > 120:
-                self.check_clearance()
-                self.is_scanning = False
-        
         # Update Matrix Rain for the big event
         if self.grounding_level == 2:
-            if len(self.matrix_rain) < 100:
-                self.matrix_rain.append([random.randint(0, WIDTH), random.randint(-100, 0), random.randint(5, 15)])
-            
-            for drop in self.matrix_rain:
-                drop[1] += drop[2]
-                if drop[1] > HEIGHT:
-                    drop[1] = random.randint(-50, 0)
-                    drop[0] = random.randint(0, WIDTH)
+            if self.n_drops < self.matrix_rain.shape[0]:
+                self.matrix_rain[self.n_drops] = (_RNG.integers(0, WIDTH + 1),
+                                                  _RNG.integers(-100, 1),
+                                                  _RNG.integers(5, 16))
+                self.n_drops += 1
+
+            drops = self.matrix_rain[:self.n_drops]
+            drops[:, 1] += drops[:, 2]
+            wrap = drops[:, 1] > HEIGHT
+            n_wrap = int(wrap.sum())
+            if n_wrap:
+                drops[wrap, 1] = _RNG.integers(-50, 1, n_wrap)
+                drops[wrap, 0] = _RNG.integers(0, WIDTH + 1, n_wrap)
+
+    def _sim_tick(self):
+        """One fixed-rate simulation step. scan_timer advances in
+        frame-equivalents (60/20 = 3 per tick) so the climb curve and the
+        2-second scan duration are unchanged."""
+        if not self.is_scanning:
+            return
+        self.scan_timer += 3
+
+        # SIMULATING THE CLIMB TO 2**80
+        if self.protocol == f"HORIZON: 2^{{80}}":
+            # Exponential growth simulation
+            self.current_complexity = min(self.horizon_limit, 2**(self.scan_timer * 0.8))
+
+            # State evolution: mix toward the target every tick
+            mix = min(1.0, self.scan_timer / 120.0)
+            self.current_state = (1 - mix) * self.current_state \
+                + mix * self.target_proj
+            # Pure target: <psi|rho|psi>, one gemv plus a dot
+            self.fidelity = float(np.real(
+                self.target_psi.conj() @ self.current_state @ self.target_psi))
+            self.entropy_control = self.fidelity
+
+        if self.scan_timer > 120:
+            self.check_clearance()
+            self.is_scanning = False
 
     def check_clearance(self):
         if self.fidelity > 0.95:
@@ -160,9 +332,13 @@ class HelloFriendEntropy:
             self.channel_noise.set_volume(0.8)
 
     def draw_top_screen(self, surface, rect):
-        pygame.draw.rect(surface, (0, 10, 0), rect)
-        pygame.draw.rect(surface, HUD_COLOR, rect, 2)
-        
+        if self._top_bg is None or self._top_bg.get_size() != rect.size:
+            bg = pygame.Surface(rect.size).convert()
+            bg.fill((0, 10, 0))
+            pygame.draw.rect(bg, HUD_COLOR, bg.get_rect(), 2)
+            self._top_bg = bg
+        surface.blit(self._top_bg, rect.topleft)
+
         clip_rect = surface.get_clip()
         surface.set_clip(rect)
         
@@ -176,90 +352,140 @@ class HelloFriendEntropy:
             pygame.draw.circle(surface, HORIZON_COLOR, (cx, cy), r, 2)
             pygame.draw.circle(surface, (255, 255, 200), (cx, cy), r-5)
             
-            msg = self.font_main.render(f"{self.horizon_limit:,}", True, (0, 0, 0))
-            # Center the massive number
-            if msg.get_width() > rect.width - 20:
-                msg = pygame.transform.scale(msg, (rect.width - 40, msg.get_height()))
+            # Center the massive number (rendered and scaled-to-fit once)
+            if self._horizon_msg is None:
+                msg = self._text(self.font_main, f"{self.horizon_limit:,}", (0, 0, 0))
+                if msg.get_width() > rect.width - 20:
+                    msg = pygame.transform.scale(msg, (rect.width - 40, msg.get_height()))
+                self._horizon_msg = msg
+            msg = self._horizon_msg
             surface.blit(msg, (cx - msg.get_width()//2, cy - msg.get_height()//2))
-            
-            lbl = self.font_small.render("COMPLEXITY LIMIT REACHED", True, HORIZON_COLOR)
+
+            lbl = self._text(self.font_small, "COMPLEXITY LIMIT REACHED", HORIZON_COLOR)
             surface.blit(lbl, (cx - lbl.get_width()//2, cy + 50))
             
         else:
-            # Show the climbing number
-            disp_num = int(self.current_complexity)
-            # Logarithmic bars
-            bars = int(math.log(max(1, disp_num), 2))
-            
-            for i in range(bars):
-                bx = rect.x + 20 + (i * 8)
-                bh = 5 + (math.sin(i + self.angle_y) * 5)
+            # Logarithmic bars (floor(log2), computed once in update): all
+            # geometry and colors come out of one vectorized pass, leaving
+            # only SDL's fastest filled-rect primitive per visible bar.
+            bars = self.bars
+            if bars:
+                i = np.arange(bars)
+                bx = rect.x + 20 + i * 8
+                keep = bx < rect.right - 20
+                i, bx = i[keep], bx[keep]
+                bh = 5 + np.sin(i + self.angle_y) * 5
                 # Color shifts from Green to Red as it approaches 80
-                c_fac = min(1.0, i / 80.0)
-                col = (int(255 * c_fac), int(255 * (1-c_fac)), 100)
-                
-                if bx < rect.right - 20:
-                    pygame.draw.rect(surface, col, (bx, cy - bh, 6, bh*2))
-            
-            val_txt = f"2^{bars}"
-            lbl = self.font_large.render(val_txt, True, HUD_COLOR)
+                c_fac = np.minimum(1.0, i / 80.0)
+                reds = (255 * c_fac).astype(np.int32)
+                greens = (255 * (1 - c_fac)).astype(np.int32)
+                tops = (cy - bh).astype(np.int32)
+                heights = (bh * 2).astype(np.int32)
+                for x, top, h, red, green in zip(bx.tolist(), tops.tolist(),
+                                                 heights.tolist(), reds.tolist(),
+                                                 greens.tolist()):
+                    surface.fill((red, green, 100), (x, top, 6, h))
+
+            val_txt = f"2^{bars}"  # bucketed: only changes when bars does
+            lbl = self._text(self.font_large, val_txt, HUD_COLOR)
             surface.blit(lbl, (cx - lbl.get_width()//2, cy - lbl.get_height()//2))
 
         surface.set_clip(clip_rect)
-        lbl = self.font_small.render("COMPUTATIONAL_HORIZON", True, (0, 100, 0))
+        lbl = self._text(self.font_small, "COMPUTATIONAL_HORIZON", (0, 100, 0))
         surface.blit(lbl, (rect.x + 5, rect.y + 5))
 
     def draw_oscilloscope(self, surface, rect):
-        pygame.draw.rect(surface, (0, 0, 0), rect)
-        pygame.draw.rect(surface, HUD_COLOR, rect, 2)
+        if self._osc_bg is None or self._osc_bg.get_size() != rect.size:
+            bg = pygame.Surface(rect.size).convert()
+            bg.fill((0, 0, 0))
+            pygame.draw.rect(bg, HUD_COLOR, bg.get_rect(), 2)
+            self._osc_bg = bg
+        surface.blit(self._osc_bg, rect.topleft)
         cx, cy = rect.centerx, rect.centery
 
+        # Trace buffers keyed to the rect: x coords and normalized positions
+        # never change, so only the y column is refilled per frame.
+        if self._osc_rect != (rect.x, rect.right):
+            xs = np.arange(rect.x, rect.right, 2, dtype=np.float32)
+            self._osc_nx = (xs - rect.x) / rect.width
+            self._osc_ones = np.ones_like(xs)
+            self._osc_y = np.empty_like(xs)
+            self._osc_pts = np.empty((xs.shape[0], 2), dtype=np.int32)
+            self._osc_pts[:, 0] = xs
+            self._osc_idx = np.arange(xs.shape[0])
+            self._osc_xloc = (xs - rect.x).astype(np.int32)
+            self._osc_rect = (rect.x, rect.right)
+            layer = pygame.Surface(rect.size).convert()
+            layer.set_colorkey((0, 0, 0))  # black stays transparent
+            self._sig_layer = layer
+        # Hot buffers and scalars as locals: one attribute load each
+        nx = self._osc_nx
+        y_buf = self._osc_y
+        pts = self._osc_pts
+        angle_y = self.angle_y
+
         # Matrix Rain Effect in background for 2**80
         if self.grounding_level == 2:
-            for drop in self.matrix_rain:
-                if rect.collidepoint(drop[0], rect.y + 10): # Simple containment check
-                     txt = self.font_micro.render(str(random.randint(0,1)), True, (0, 100, 0))
-                     surface.blit(txt, (drop[0], rect.y + (drop[1] % rect.height)))
-
-            # Pure Signal
-            points = []
-            for x in range(rect.x, rect.right, 2):
-                nx = (x - rect.x) / rect.width
-                y = cy + math.sin(nx * 50 + self.angle_y * 20) * 40
-                points.append((x, y))
-            if len(points) > 1:
-                pygame.draw.lines(surface, HORIZON_COLOR, False, points, 2)
+            glyphs = self._rain_glyphs
+            blits = [(glyphs[random.getrandbits(1)],
+                      (int(x), rect.y + (int(y) % rect.height)))
+                     for x, y, _ in self.matrix_rain[:self.n_drops]
+                     if rect.collidepoint(int(x), rect.y + 10)]  # Simple containment check
+            if blits:
+                surface.blits(blits, doreturn=0)
+
+            # Pure Signal: one kernel call over the cached x buffer
+            _osc_wave(nx, float(cy), 50.0, angle_y * 20, 40.0,
+                      self._osc_ones, y_buf)
+            pts[:, 1] = y_buf
+            self._blit_signal(surface, rect, HORIZON_COLOR, thick=True)
                 
-            msg = self.font_large.render("HELLO FRIEND", True, HUD_COLOR)
+            msg = self._text(self.font_large, "HELLO FRIEND", HUD_COLOR)
             surface.blit(msg, (cx - msg.get_width()//2, cy - msg.get_height()//2))
             
         else:
             # Chaos Noise
-            points = []
-            for x in range(rect.x, rect.right, 2):
-                nx = (x - rect.x) / rect.width
-                # Amplitude based on how close we are to 80
-                amp = 30 + (math.log(max(1, self.current_complexity), 2) / 2)
-                y = cy + math.sin(nx * 100 + self.angle_y*5) * amp * random.random()
-                points.append((x, y))
-            if len(points) > 1:
-                pygame.draw.lines(surface, (50, 50, 50), False, points, 1)
+            # Amplitude based on how close we are to 80
+            amp = 30 + self.bars / 2
+            # Slice the noise ring at the current scan phase — no RNG call
+            noise = self._noise_lut[(self._osc_idx + self.scan_timer) & 4095]
+            _osc_wave(nx, float(cy), 100.0, angle_y * 5, amp,
+                      noise, y_buf)
+            pts[:, 1] = y_buf
+            self._blit_signal(surface, rect, (50, 50, 50))
             
-            stat = self.font_main.render(f"PROCESSING: {int(self.current_complexity):.1e}", True, HUD_COLOR)
+            stat = self._text(self.font_main, f"PROCESSING: {int(self.current_complexity):.1e}", HUD_COLOR)
             surface.blit(stat, (cx - stat.get_width()//2, cy))
 
-        lbl = self.font_small.render("SIGNAL::ENTROPY_DENSITY", True, (0, 100, 0))
+        lbl = self._text(self.font_small, "SIGNAL::ENTROPY_DENSITY", (0, 100, 0))
         surface.blit(lbl, (rect.x + 5, rect.y + 5))
 
+    def _blit_signal(self, surface, rect, color, thick=False):
+        """Plot the current trace onto the colorkeyed signal strip in one
+        bulk pixel write and blit it — no per-point tuple marshalling."""
+        layer = self._sig_layer
+        layer.fill((0, 0, 0))
+        px = pygame.surfarray.pixels3d(layer)
+        ys = np.clip(self._osc_pts[:, 1] - rect.y, 0, rect.height - 1)
+        px[self._osc_xloc, ys] = color
+        if thick:
+            px[self._osc_xloc, np.minimum(ys + 1, rect.height - 1)] = color
+        del px  # release the surface lock
+        surface.blit(layer, rect.topleft)
+
     def draw_bloch_sphere(self, surface, rect):
-        pygame.draw.rect(surface, (10, 15, 25), rect)
-        pygame.draw.rect(surface, HUD_COLOR, rect, 1)
-        
         cx, cy = rect.centerx, rect.centery
         r = 80
-        
-        pygame.draw.circle(surface, ACCENT_COLOR, (cx, cy), r, 1)
-        pygame.draw.ellipse(surface, ACCENT_COLOR, (cx-r, cy-r//3, r*2, r*0.66), 1)
+
+        if self._bloch_bg is None or self._bloch_bg.get_size() != rect.size:
+            bg = pygame.Surface(rect.size).convert()
+            bg.fill((10, 15, 25))
+            pygame.draw.rect(bg, HUD_COLOR, bg.get_rect(), 1)
+            lx, ly = rect.width // 2, rect.height // 2
+            pygame.draw.circle(bg, ACCENT_COLOR, (lx, ly), r, 1)
+            pygame.draw.ellipse(bg, ACCENT_COLOR, (lx-r, ly-r//3, r*2, r*0.66), 1)
+            self._bloch_bg = bg
+        surface.blit(self._bloch_bg, rect.topleft)
 
         if self.grounding_level == 2:
             # The Golden Vector (2**80 state)
@@ -272,23 +498,28 @@ class HelloFriendEntropy:
             # Orbital rings representing density
             pygame.draw.ellipse(surface, HORIZON_COLOR, (cx-r//2, cy-r, r, r*2), 1)
             
-            lbl = self.font_small.render("∞ COLLAPSED", True, HORIZON_COLOR)
+            lbl = self._text(self.font_small, "∞ COLLAPSED", HORIZON_COLOR)
             surface.blit(lbl, (cx - lbl.get_width()//2, cy - 10))
             
         else:
-            # Cloud of points representing the search space
-            count = int(math.log(max(2, self.current_complexity), 2)) * 2
-            for i in range(min(count, 100)):
-                rx = cx + random.randint(-r, r)
-                ry = cy + random.randint(-r, r)
-                # Check coords inside circle
-                if math.hypot(rx-cx, ry-cy) < r:
-                    pygame.draw.circle(surface, (0, 255, 255), (rx, ry), 1)
-
-            lbl = self.font_small.render("SEARCHING HILBERT SPACE", True, (100, 100, 100))
+            # Cloud of points representing the search space, sampled
+            # directly in polar coordinates (sqrt-of-uniform radius keeps
+            # the density uniform over the disc) — every draw lands inside
+            # the sphere, no rejection pass, one bulk pixel write.
+            count = min(max(1, self.bars) * 2, 100)
+            if count:
+                theta = _RNG.random(count, dtype=np.float32) * np.float32(2 * np.pi)
+                rr = r * np.sqrt(_RNG.random(count, dtype=np.float32))
+                xs = (cx + rr * np.cos(theta)).astype(np.int32)
+                ys = (cy + rr * np.sin(theta)).astype(np.int32)
+                px = pygame.surfarray.pixels3d(surface)
+                px[xs, ys] = (0, 255, 255)
+                del px  # release the surface lock
+
+            lbl = self._text(self.font_small, "SEARCHING HILBERT SPACE", (100, 100, 100))
             surface.blit(lbl, (cx - lbl.get_width()//2, cy + r + 10))
 
-        lbl = self.font_small.render("QUANTUM_STATE", True, ACCENT_COLOR)
+        lbl = self._text(self.font_small, "QUANTUM_STATE", ACCENT_COLOR)
         surface.blit(lbl, (rect.x + 5, rect.y + 5))
 
     def run(self):
@@ -298,8 +529,10 @@ class HelloFriendEntropy:
         rect_bot = pygame.Rect(20, 350, 600, 250)
         rect_side = pygame.Rect(640, 80, 340, 300)
         rect_btn = pygame.Rect(640, 400, 340, 100)
+        last_ui_sig = None  # forces a full repaint on the first frame
 
         while running:
+            dt = self.clock.tick(FPS) / 1000.0
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     running = False
@@ -307,32 +540,52 @@ class HelloFriendEntropy:
                     if rect_btn.collidepoint(event.pos):
                         self.cycle_protocol()
 
-            self.update()
-            self.screen.fill(BG_COLOR)
-            
-            head = self.font_large.render("SYSTEM//:HORIZON_LIMIT", True, HUD_COLOR)
-            self.screen.blit(head, (20, 20))
-            
-            self.draw_top_screen(self.screen, rect_top)
+            self.update(dt)
+
+            # Dirty-rect compositing: the backdrop, header and button are
+            # repainted only when UI state flips; every other frame pushes
+            # just the panels that actually animate.
+            ui_sig = (self.protocol, self.status_msg, self.is_scanning,
+                      self.grounding_level)
+            full = ui_sig != last_ui_sig
+            last_ui_sig = ui_sig
+
+            if full:
+                self.screen.fill(BG_COLOR)
+                self.screen.blit(self._stars_layer, (0, 0))
+
+                head = self._text(self.font_large, "SYSTEM//:HORIZON_LIMIT", HUD_COLOR)
+                self.screen.blit(head, (20, 20))
+
+                pygame.draw.rect(self.screen, (20, 30, 40), rect_btn)
+                border_col = HUD_COLOR if not self.is_scanning else (100, 100, 100)
+                pygame.draw.rect(self.screen, border_col, rect_btn, 2)
+
+                status = self._text(self.font_main, self.protocol, ACCENT_COLOR)
+                self.screen.blit(status, (rect_btn.x + 10, rect_btn.y + 10))
+
+                sub_status = self._text(self.font_small, self.status_msg, HORIZON_COLOR if self.grounding_level == 2 else ALERT_COLOR)
+                self.screen.blit(sub_status, (rect_btn.x + 10, rect_btn.y + 40))
+
+                btn_lbl = "CALCULATING..." if self.is_scanning else f"INITIATE 2^80"
+                btn_txt = self._text(self.font_main, btn_lbl, HUD_COLOR)
+                self.screen.blit(btn_txt, (rect_btn.centerx - btn_txt.get_width()//2, rect_btn.bottom - 30))
+
+            dirty = []
+            # Top panel is static while idle at 2^0; redraw it only when the
+            # bars wiggle or the collapse display is live.
+            if full or self.bars or self.grounding_level == 2:
+                self.draw_top_screen(self.screen, rect_top)
+                dirty.append(rect_top)
             self.draw_oscilloscope(self.screen, rect_bot)
+            dirty.append(rect_bot)
             self.draw_bloch_sphere(self.screen, rect_side)
-            
-            pygame.draw.rect(self.screen, (20, 30, 40), rect_btn)
-            border_col = HUD_COLOR if not self.is_scanning else (100, 100, 100)
-            pygame.draw.rect(self.screen, border_col, rect_btn, 2)
-            
-            status = self.font_main.render(self.protocol, True, ACCENT_COLOR)
-            self.screen.blit(status, (rect_btn.x + 10, rect_btn.y + 10))
-            
-            sub_status = self.font_small.render(self.status_msg, True, HORIZON_COLOR if self.grounding_level == 2 else ALERT_COLOR)
-            self.screen.blit(sub_status, (rect_btn.x + 10, rect_btn.y + 40))
-            
-            btn_lbl = "CALCULATING..." if self.is_scanning else f"INITIATE 2^80"
-            btn_txt = self.font_main.render(btn_lbl, True, HUD_COLOR)
-            self.screen.blit(btn_txt, (rect_btn.centerx - btn_txt.get_width()//2, rect_btn.bottom - 30))
+            dirty.append(rect_side)
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            if full:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty)
 
         pygame.quit()
 